@@ -26,6 +26,5 @@ class EndpointError(Exception):
         super().__init__(message)
 
 
-
 class ResponseFormatError(Exception):
     """Возникает при нарушении формата ответа API (нет ключей, ошибка типа)."""
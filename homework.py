@@ -1,32 +1,58 @@
 """Бот для проверки статусов в Практикуме и отправки уведомлений в Telegram."""
 
 import logging
+import os
+import random
 import sys
 import time
+from http import HTTPStatus
 
+import orjson
 import requests
-from dotenv import load_dotenv, dotenv_values
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from telebot import TeleBot, apihelper
+from urllib3.util.retry import Retry
 
 from exceptions import EndpointError, ResponseFormatError
 
 load_dotenv()
-config = dotenv_values(".env")
 
-PRACTICUM_TOKEN = config.get("PRACTICUM_TOKEN")
-TELEGRAM_TOKEN = config.get("TELEGRAM_TOKEN")
-TELEGRAM_CHAT_ID = config.get("TELEGRAM_CHAT_ID")
+PRACTICUM_TOKEN = os.getenv("PRACTICUM_TOKEN")
+TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
+TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
 RETRY_PERIOD = 600
+MIN_RETRY_PERIOD = 60
+RETRY_JITTER = 0.25
 ENDPOINT = "https://practicum.yandex.ru/api/user_api/homework_statuses/"
 TIMEOUT = 10
 HEADERS = {"Authorization": f"OAuth {PRACTICUM_TOKEN}"}
 
+RETRY = Retry(
+    total=3,
+    backoff_factor=1.0,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False
+)
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(max_retries=RETRY, pool_connections=2, pool_maxsize=4)
+)
+
 HOMEWORK_VERDICTS = {
     "approved": "Работа проверена: ревьюеру всё понравилось. Ура!",
     "reviewing": "Работа взята на проверку ревьюером.",
     "rejected": "Работа проверена: у ревьюера есть замечания."
 }
+REQUIRED_KEYS = frozenset(("homework_name", "status"))
+MESSAGE_LIMIT = 4000
+MESSAGE_SEPARATOR = "\n\n"
+STATUS_TEMPLATE = (
+    'Изменился статус проверки работы "{homework_name}". {verdict}'
+)
 
 
 class MissingEnvVarsError(Exception):
@@ -65,23 +91,26 @@ def send_message(bot, message):
     Returns:
         bool: True, если сообщение отправлено успешно, False — в случае ошибки.
     """
-    logging.info(f"Попытка отправки сообщения в Telegram: {message}")
+    logging.info("Попытка отправки сообщения в Telegram: %s", message)
     try:
         bot.send_message(
             chat_id=TELEGRAM_CHAT_ID,
             text=message,
             timeout=TIMEOUT
         )
-        logging.debug(f"Бот отправил сообщение: {message}")
+        logging.debug("Бот отправил сообщение: %s", message)
         return True
     except (apihelper.ApiException, requests.RequestException) as e:
-        logging.error(f"Ошибка отправки в Telegram: {e}")
+        logging.error("Ошибка отправки в Telegram: %s", e)
         return False
 
 
 def get_api_answer(timestamp):
     """Отправляет запрос к API Практикума.
 
+    Временные сбои (сетевые ошибки и ответы 5xx) повторяет адаптер
+    сессии по политике RETRY, переиспользуя соединение из пула.
+
     Args:
         timestamp (int): Метка времени для фильтрации работ.
 
@@ -92,10 +121,10 @@ def get_api_answer(timestamp):
         EndpointError: Если запрос не удался или статус ответа ≠ 200.
     """
     params = {"from_date": timestamp}
-    logging.info(f"Запрос к {ENDPOINT}, параметры: {params}")
+    logging.info("Запрос к %s, параметры: %s", ENDPOINT, params)
 
     try:
-        response = requests.get(
+        response = SESSION.get(
             ENDPOINT,
             headers=HEADERS,
             params=params,
@@ -104,10 +133,10 @@ def get_api_answer(timestamp):
     except requests.RequestException as e:
         raise EndpointError(message=f"Ошибка запроса: {e}") from e
 
-    if response.status_code != getattr(requests.codes, 'ok'):  # type: ignore
+    if response.status_code != HTTPStatus.OK:
         raise EndpointError(response=response)
 
-    return response.json()
+    return orjson.loads(response.content)
 
 
 def check_response(response):
@@ -122,12 +151,14 @@ def check_response(response):
     Raises:
         TypeError: Если ответ не соответствует ожидаемому формату.
     """
-    if not isinstance(response, dict):
-        raise TypeError(f"Ответ API не словарь, получен {type(response)}")
-    if "homeworks" not in response:
-        raise TypeError("В ответе отсутствует ключ 'homeworks'")
-    homeworks = response["homeworks"]
-    if not isinstance(homeworks, list):
+    try:
+        homeworks = response["homeworks"]
+    except TypeError:
+        raise TypeError(
+            f"Ответ API не словарь, получен {type(response)}") from None
+    except KeyError:
+        raise TypeError("В ответе отсутствует ключ 'homeworks'") from None
+    if type(homeworks) is not list:
         raise TypeError(
             f"Поле 'homeworks' не список, получен {type(homeworks)}")
     return homeworks
@@ -146,10 +177,11 @@ def parse_status(homework):
         ResponseFormatError: Если в работе отсутствуют обязательные поля
             или статус неизвестен.
     """
-    required_keys = ["homework_name", "status"]
-    for key in required_keys:
-        if key not in homework:
-            raise ResponseFormatError(f"В работе отсутствует ключ '{key}'")
+    missing = REQUIRED_KEYS.difference(homework)
+    if missing:
+        raise ResponseFormatError(
+            f"В работе отсутствуют ключи: {', '.join(sorted(missing))}"
+        )
 
     homework_name = homework["homework_name"]
     status = homework["status"]
@@ -157,41 +189,128 @@ def parse_status(homework):
     if status not in HOMEWORK_VERDICTS:
         raise ResponseFormatError(f"Неизвестный статус: {status}")
 
-    verdict = HOMEWORK_VERDICTS[status]
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    return STATUS_TEMPLATE.format(
+        homework_name=homework_name,
+        verdict=HOMEWORK_VERDICTS[status]
+    )
+
+
+def build_messages(homeworks):
+    """Формирует сообщения о статусах для списка работ.
+
+    Работа с некорректными данными не прерывает обработку остальных:
+    ошибка логируется и попадает в отчёт вместо статуса этой работы.
+
+    Args:
+        homeworks (list): Работы из ответа API.
+
+    Returns:
+        list[str]: Сообщения о статусах и об ошибках разбора.
+    """
+    messages = []
+    for homework in homeworks:
+        try:
+            messages.append(parse_status(homework))
+        except (ResponseFormatError, TypeError) as error:
+            logging.error("Некорректные данные работы: %s", error)
+            messages.append(f"Некорректные данные работы: {error}")
+    return messages
+
+
+def batch_messages(messages):
+    """Объединяет сообщения в пакеты для отправки в Telegram.
+
+    Сообщения склеиваются через MESSAGE_SEPARATOR, пока длина пакета
+    не превышает MESSAGE_LIMIT. Сообщение никогда не разрезается.
+
+    Args:
+        messages (list[str]): Тексты сообщений.
+
+    Returns:
+        list[str]: Тексты пакетов в исходном порядке.
+    """
+    batches = []
+    batch = []
+    length = 0
+    for message in messages:
+        added = len(message) + (len(MESSAGE_SEPARATOR) if batch else 0)
+        if batch and length + added > MESSAGE_LIMIT:
+            batches.append(MESSAGE_SEPARATOR.join(batch))
+            batch = []
+            length = 0
+            added = len(message)
+        batch.append(message)
+        length += added
+    if batch:
+        batches.append(MESSAGE_SEPARATOR.join(batch))
+    return batches
+
+
+def send_batches(bot, batches):
+    """Отправляет пакеты сообщений по порядку до первой неудачи.
+
+    Args:
+        bot (TeleBot): Экземпляр Telegram‑бота.
+        batches (list[str]): Тексты пакетов.
+
+    Returns:
+        list[str]: Пакеты, которые не удалось доставить.
+    """
+    for index, text in enumerate(batches):
+        if not send_message(bot, text):
+            return batches[index:]
+    return []
 
 
 def main():
-    """Основная логика работы бота."""
+    """Основная логика работы бота.
+
+    Интервал опроса адаптивный: после доставленных статусов он
+    сбрасывается до MIN_RETRY_PERIOD, после пустого ответа или ошибки
+    удваивается вплоть до RETRY_PERIOD. Задержка размывается
+    на ±RETRY_JITTER.
+    """
     check_tokens()
     bot = TeleBot(TELEGRAM_TOKEN)
     timestamp = int(time.time())
-    last_error = None
+    last_error_msg = None
+    pending = []
+    period = MIN_RETRY_PERIOD
 
     while True:
+        next_period = min(period * 2, RETRY_PERIOD)
         try:
             response = get_api_answer(timestamp)
             homeworks = check_response(response)
+            timestamp = response.get("current_date", timestamp)
 
             if homeworks:
-                homework = homeworks[0]
-                message = parse_status(homework)
-                if send_message(bot, message):
-                    timestamp = response.get("current_date", timestamp)
-                    last_error = None
+                pending.extend(batch_messages(build_messages(homeworks)))
             else:
                 logging.debug("Нет новых статусов")
+            # Недоставленные пакеты ждут следующего опроса: курсор уже
+            # сдвинут, и повторно API эти статусы не вернёт.
+            if pending:
+                pending = send_batches(bot, pending)
+                if not pending:
+                    last_error_msg = None
+                    next_period = MIN_RETRY_PERIOD
 
         except Exception as error:
-            error_msg = f'Сбой в работе программы: {error}'
-            logging.error(error_msg)
+            logging.error("Сбой в работе программы: %s", error)
 
-            if str(error) != str(last_error):
+            # Храним только текст: args исключения могут ссылаться
+            # на ответы и соединения, которые иначе не освободятся.
+            error_msg = f"Сбой в работе программы: {error}"
+            if error_msg != last_error_msg:
                 send_message(bot, error_msg)
-                last_error = error
+                last_error_msg = error_msg
 
         finally:
-            time.sleep(RETRY_PERIOD)
+            period = next_period
+            delay = period * random.uniform(1 - RETRY_JITTER, 1 + RETRY_JITTER)
+            delay = min(max(delay, MIN_RETRY_PERIOD), RETRY_PERIOD)
+            time.sleep(delay)
 
 
 if __name__ == '__main__':
@@ -200,7 +319,7 @@ if __name__ == '__main__':
         format="%(asctime)s,%(msecs)03d [%(levelname)s] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
         handlers=[
-            logging.FileHandler("bot.log", encoding="utf-8"),
+            logging.FileHandler("bot.log", encoding="utf-8", delay=True),
             logging.StreamHandler(sys.stdout)
         ]
     )
@@ -210,5 +329,5 @@ if __name__ == '__main__':
     except MissingEnvVarsError:
         sys.exit(1)
     except Exception as e:
-        logging.critical(f"Критическая ошибка: {e}")
+        logging.critical("Критическая ошибка: %s", e)
         sys.exit(1)
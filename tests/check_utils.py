@@ -1,3 +1,4 @@
+import json
 import logging
 import signal
 import re
@@ -96,6 +97,7 @@ class MockResponseGET:
             'current_date': self.random_timestamp
         }
         self.data = data if data is not None else default_data
+        self.content = json.dumps(self.data).encode()
         logging.warn(MockResponseGET.CALLED_LOG_MSG)
 
     def json(self):
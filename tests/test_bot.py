@@ -1,6 +1,7 @@
 import inspect
 import logging
 import platform
+import random
 import re
 import time
 from http import HTTPStatus
@@ -203,7 +204,9 @@ class TestHomework:
                     'Проверьте, что в параметре `from_date` передано число.'
                 )
 
-        monkeypatch.setattr(requests, 'get', check_request_call)
+        monkeypatch.setattr(
+            homework_module.SESSION, 'get', check_request_call
+        )
         try:
             homework_module.get_api_answer(current_timestamp)
         except AssertionError:
@@ -228,7 +231,9 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(
+            homework_module.SESSION, 'get', mock_response_get
+        )
 
         result = homework_module.get_api_answer(current_timestamp)
         assert isinstance(result, dict), (
@@ -246,7 +251,7 @@ class TestHomework:
             self.HOMEWORK_FUNC_WITH_PARAMS_QTY[func_name]
         )
 
-        monkeypatch.setattr(requests, 'get', response)
+        monkeypatch.setattr(homework_module.SESSION, 'get', response)
         try:
             homework_module.get_api_answer(current_timestamp)
         except Exception:
@@ -270,7 +275,9 @@ class TestHomework:
         def mock_request_get_with_exception(*args, **kwargs):
             raise requests.RequestException('Something wrong')
 
-        monkeypatch.setattr(requests, 'get', mock_request_get_with_exception)
+        monkeypatch.setattr(
+            homework_module.SESSION, 'get', mock_request_get_with_exception
+        )
         try:
             homework_module.get_api_answer(current_timestamp)
         except requests.RequestException as e:
@@ -461,6 +468,62 @@ class TestHomework:
             else:
                 raise AssertionError(assert_message)
 
+    def test_batch_messages(self, homework_module):
+        limit = homework_module.MESSAGE_LIMIT
+        messages = ['a' * (limit // 2), 'b' * (limit // 2), 'c']
+        batches = homework_module.batch_messages(messages)
+        assert len(batches) == 2, (
+            'Убедитесь, что сообщения, не помещающиеся в `MESSAGE_LIMIT`, '
+            'разбиваются на несколько пакетов.'
+        )
+        assert all(len(batch) <= limit for batch in batches), (
+            'Убедитесь, что пакет сообщений не длиннее `MESSAGE_LIMIT`.'
+        )
+        assert ''.join(batches).replace('\n', '') == ''.join(messages), (
+            'Убедитесь, что при объединении сообщения не теряются '
+            'и сохраняют порядок.'
+        )
+        assert homework_module.batch_messages(['x', 'y']) == ['x\n\ny'], (
+            'Убедитесь, что короткие сообщения отправляются одним пакетом.'
+        )
+
+    def test_build_messages_skips_invalid_homework(self, homework_module):
+        homeworks = [
+            {'homework_name': 'hw1', 'status': 'unknown'},
+            {'homework_name': 'hw2', 'status': 'approved'},
+        ]
+        messages = homework_module.build_messages(homeworks)
+        assert len(messages) == 2, (
+            'Убедитесь, что некорректная работа не мешает '
+            'сформировать сообщения об остальных.'
+        )
+        assert self.HOMEWORK_VERDICTS['approved'] in messages[1], (
+            'Убедитесь, что статус корректной работы попадает в отчёт.'
+        )
+
+    def test_send_batches_returns_undelivered(self, homework_module):
+        class FlakyBot(check_utils.MockTelegramBot):
+            sent = []
+
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                if text == 'second':
+                    raise telebot.apihelper.ApiException(
+                        'Ошибка отправки.', 'send_message', 500
+                    )
+                self.sent.append(text)
+
+        bot = FlakyBot()
+        pending = homework_module.send_batches(
+            bot, ['first', 'second', 'third']
+        )
+        assert bot.sent == ['first'], (
+            'Убедитесь, что отправка останавливается на первой ошибке.'
+        )
+        assert pending == ['second', 'third'], (
+            'Убедитесь, что недоставленные пакеты возвращаются '
+            'для повторной отправки.'
+        )
+
     def test_send_message(
             self, monkeypatch, random_message, caplog, homework_module
     ):
@@ -559,9 +622,11 @@ class TestHomework:
             if caller != 'main':
                 old_sleep(secs)
                 return
-            assert secs == 600, (
+            min_period = homework_module.MIN_RETRY_PERIOD
+            assert min_period <= secs <= self.RETRY_PERIOD, (
                 'Убедитесь, что повторный запрос к API домашки отправляется '
-                'через 10 минут: `time.sleep(RETRY_PERIOD)`.'
+                'не чаще чем раз в `MIN_RETRY_PERIOD` и не реже чем раз '
+                'в 10 минут (`RETRY_PERIOD`).'
             )
             raise check_utils.BreakInfiniteLoop('break')
 
@@ -595,7 +660,7 @@ class TestHomework:
                 data=response_data
             ))
         monkeypatch.setattr(
-            requests,
+            homework_module.SESSION,
             'get',
             mock_response_get_with_new_status
         )
@@ -658,7 +723,7 @@ class TestHomework:
                     )
                 ]
                 assert log_record, (
-                    'Убедитесь, что бот использует функцию `requests.get()` '
+                    'Убедитесь, что бот использует функцию `SESSION.get()` '
                     'для отправки запроса к API домашки.'
                 )
 
@@ -822,6 +887,53 @@ class TestHomework:
                     'возникновении ошибки отправки сообщения в Телеграм.'
                 ) from e
 
+    def test_main_adaptive_retry_period(
+            self, monkeypatch, random_timestamp, data_with_new_hw_status,
+            homework_module
+    ):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(
+            homework_module, 'TeleBot', check_utils.MockTelegramBot
+        )
+        monkeypatch.setattr(random, 'uniform', lambda a, b: 1.0)
+
+        empty_response = {'homeworks': [], 'current_date': random_timestamp}
+        responses = iter([empty_response] * 5 + [data_with_new_hw_status]
+                         + [empty_response])
+        monkeypatch.setattr(
+            homework_module, 'get_api_answer',
+            lambda timestamp: next(responses)
+        )
+        monkeypatch.setattr(
+            homework_module, 'send_message', lambda bot, message: True
+        )
+
+        sleeps = []
+
+        def record_sleep(secs):
+            sleeps.append(secs)
+            if len(sleeps) == 7:
+                raise check_utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(time, 'sleep', record_sleep)
+        try:
+            homework_module.main()
+        except check_utils.BreakInfiniteLoop:
+            pass
+
+        min_period = homework_module.MIN_RETRY_PERIOD
+        assert sleeps == [
+            2 * min_period, 4 * min_period, 8 * min_period,
+            self.RETRY_PERIOD, self.RETRY_PERIOD,
+            min_period, 2 * min_period
+        ], (
+            'Убедитесь, что после доставленного статуса следующий запрос '
+            'отправляется через `MIN_RETRY_PERIOD`, а после пустых ответов '
+            'интервал удваивается вплоть до `RETRY_PERIOD`.'
+        )
+
     def test_docstrings(self, homework_module):
         for func in self.HOMEWORK_FUNC_WITH_PARAMS_QTY:
             check_utils.check_docstring(homework_module, func)